@@ -0,0 +1,268 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Native inner loop for the epoll scanning backend (Linux only).
+
+Works like scan_ports_epoll in app.py, but creating sockets, starting the
+non-blocking connects, waiting on epoll and reading SO_ERROR all happen in C
+without the GIL, so the interpreter only sees finished ports.
+
+Build in place with:
+    python setup.py build_ext --inplace
+"""
+from libc.errno cimport errno, EINPROGRESS, ETIMEDOUT
+from libc.stdint cimport uint16_t, uint32_t, uint64_t
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy, memset
+from posix.time cimport clock_gettime, timespec, CLOCK_MONOTONIC
+from posix.unistd cimport close
+
+cdef extern from "<sys/socket.h>" nogil:
+    ctypedef unsigned int socklen_t
+    struct sockaddr:
+        pass
+    struct linger:
+        int l_onoff
+        int l_linger
+    int AF_INET, SOCK_STREAM, SOCK_NONBLOCK, SOCK_CLOEXEC
+    int SOL_SOCKET, SO_ERROR, SO_LINGER
+    int socket(int domain, int type, int protocol)
+    int connect(int fd, const sockaddr *addr, socklen_t addrlen)
+    int getsockopt(int fd, int level, int optname, void *optval, socklen_t *optlen)
+    int setsockopt(int fd, int level, int optname, const void *optval, socklen_t optlen)
+
+cdef extern from "<netinet/in.h>" nogil:
+    int IPPROTO_TCP
+    struct in_addr:
+        uint32_t s_addr
+    struct sockaddr_in:
+        unsigned short sin_family
+        uint16_t sin_port
+        in_addr sin_addr
+    uint16_t htons(uint16_t hostshort)
+
+cdef extern from "<netinet/tcp.h>" nogil:
+    int TCP_NODELAY
+
+cdef extern from "<sys/epoll.h>" nogil:
+    ctypedef union epoll_data_t:
+        int fd
+        uint64_t u64
+    struct epoll_event:
+        uint32_t events
+        epoll_data_t data
+    int EPOLLOUT, EPOLL_CTL_ADD, EPOLL_CLOEXEC
+    int epoll_create1(int flags)
+    int epoll_ctl(int epfd, int op, int fd, epoll_event *event)
+    int epoll_wait(int epfd, epoll_event *events, int maxevents, int timeout)
+
+cdef enum:
+    # Marks a port whose connection attempt is still in flight
+    PENDING = -1
+
+cdef inline double _now_ms() noexcept nogil:
+    cdef timespec ts
+    clock_gettime(CLOCK_MONOTONIC, &ts)
+    return ts.tv_sec * 1000.0 + ts.tv_nsec / 1000000.0
+
+
+cdef class Scanner:
+    """
+    Scan `ports` on one IPv4 address, keeping at most `window` connection
+    attempts in flight.
+
+    Results are written to the caller's buffers: errors[i] receives the errno
+    of the connect to ports[i] (0 means open) and order lists port indices in
+    the order they finished. Call run() repeatedly until it returns len(ports).
+    A positive `rate` caps how many connection attempts start per second, with
+    the same token bucket as app.TokenBucket.
+    """
+    cdef const unsigned short[::1] ports
+    cdef int[::1] errors
+    cdef int[::1] order
+    cdef sockaddr_in addr
+    cdef double timeout_ms
+    cdef double rate, capacity, tokens, refilled
+    cdef int window
+    cdef int epfd
+    cdef bint ready
+    cdef Py_ssize_t n, started, head, done
+    cdef int active, nfree
+    cdef int *slot_fd
+    cdef Py_ssize_t *slot_index
+    cdef double *slot_deadline
+    cdef int *free_slots
+    cdef int *slot_of
+    cdef epoll_event *events
+
+    def __cinit__(self, bytes packed_ip, const unsigned short[::1] ports, int timeout_ms, int window, int[::1] errors, int[::1] order, double rate=0.0):
+        if len(packed_ip) != 4:
+            raise ValueError("packed_ip must be a 4 byte IPv4 address")
+        if errors.shape[0] < ports.shape[0] or order.shape[0] < ports.shape[0]:
+            raise ValueError("errors and order must be as long as ports")
+        self.ports = ports
+        self.errors = errors
+        self.order = order
+        self.n = ports.shape[0]
+        self.timeout_ms = timeout_ms
+        self.window = max(1, min(window, <int>max(self.n, 1)))
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.refilled = _now_ms()
+
+        # The address is built once; only the port changes per probe
+        memset(&self.addr, 0, sizeof(self.addr))
+        self.addr.sin_family = AF_INET
+        memcpy(&self.addr.sin_addr, <const char *>packed_ip, 4)
+
+        self.slot_fd = <int *>malloc(self.window * sizeof(int))
+        self.slot_index = <Py_ssize_t *>malloc(self.window * sizeof(Py_ssize_t))
+        self.slot_deadline = <double *>malloc(self.window * sizeof(double))
+        self.free_slots = <int *>malloc(self.window * sizeof(int))
+        self.slot_of = <int *>malloc(max(self.n, 1) * sizeof(int))
+        self.events = <epoll_event *>malloc(self.window * sizeof(epoll_event))
+        if (not self.slot_fd or not self.slot_index or not self.slot_deadline
+                or not self.free_slots or not self.slot_of or not self.events):
+            raise MemoryError()
+        for i in range(self.window):
+            self.free_slots[i] = i
+        self.nfree = self.window
+
+        self.epfd = epoll_create1(EPOLL_CLOEXEC)
+        if self.epfd < 0:
+            raise OSError(errno, "epoll_create1 failed")
+        self.ready = True
+
+    def __dealloc__(self):
+        # Also runs when __cinit__ failed (even while unpacking its
+        # arguments), when the fields are still zero and epfd isn't a
+        # descriptor of ours, so only close anything once setup completed
+        cdef Py_ssize_t i
+        if self.ready:
+            # Close anything still in flight if the scan was abandoned
+            for i in range(self.head, self.started):
+                if self.errors[i] == PENDING:
+                    close(self.slot_fd[self.slot_of[i]])
+            close(self.epfd)
+        free(self.slot_fd)
+        free(self.slot_index)
+        free(self.slot_deadline)
+        free(self.free_slots)
+        free(self.slot_of)
+        free(self.events)
+
+    def run(self, double max_ms):
+        """
+        Scan for at most `max_ms` milliseconds, or until every port is done.
+
+        Returns:
+            int: Number of ports finished so far; order[:result] holds their indices
+        """
+        with nogil:
+            self._run(max_ms)
+        return self.done
+
+    cdef inline void _finish(self, Py_ssize_t i, int error) noexcept nogil:
+        self.errors[i] = error
+        self.order[self.done] = <int>i
+        self.done += 1
+
+    cdef inline void _release(self, int slot) noexcept nogil:
+        # Closing the socket also removes it from the epoll set
+        close(self.slot_fd[slot])
+        self.free_slots[self.nfree] = slot
+        self.nfree += 1
+        self.active -= 1
+
+    cdef void _run(self, double max_ms) noexcept nogil:
+        cdef double now = _now_ms()
+        cdef double stop = now + max_ms
+        cdef Py_ssize_t i
+        cdef int fd, slot, error, ready, k, wait_ms
+        cdef int one = 1
+        cdef bint throttled
+        cdef double wait_until
+        cdef socklen_t length
+        cdef linger no_linger
+        cdef epoll_event event
+        no_linger.l_onoff = 1
+        no_linger.l_linger = 0
+
+        while self.done < self.n:
+            # Keep the window of in-flight connection attempts full, as far as
+            # the rate limit allows
+            if self.rate > 0:
+                self.tokens = min(self.capacity, self.tokens + (now - self.refilled) * self.rate / 1000.0)
+                self.refilled = now
+            while self.started < self.n and self.active < self.window:
+                if self.rate > 0:
+                    if self.tokens < 1:
+                        break
+                    self.tokens -= 1
+                i = self.started
+                self.started += 1
+                fd = socket(AF_INET, SOCK_STREAM | SOCK_NONBLOCK | SOCK_CLOEXEC, 0)
+                if fd < 0:
+                    self._finish(i, errno)
+                    continue
+                setsockopt(fd, IPPROTO_TCP, TCP_NODELAY, &one, sizeof(one))
+                setsockopt(fd, SOL_SOCKET, SO_LINGER, &no_linger, sizeof(no_linger))
+                self.addr.sin_port = htons(self.ports[i])
+                if connect(fd, <sockaddr *>&self.addr, sizeof(self.addr)) == 0:
+                    # Connected straight away
+                    close(fd)
+                    self._finish(i, 0)
+                    continue
+                if errno != EINPROGRESS:
+                    error = errno
+                    close(fd)
+                    self._finish(i, error)
+                    continue
+                # Connection is under way, wait for the socket to become writable
+                self.nfree -= 1
+                slot = self.free_slots[self.nfree]
+                self.slot_fd[slot] = fd
+                self.slot_index[slot] = i
+                self.slot_deadline[slot] = now + self.timeout_ms
+                self.slot_of[i] = slot
+                self.errors[i] = PENDING
+                event.events = EPOLLOUT
+                event.data.u64 = slot
+                epoll_ctl(self.epfd, EPOLL_CTL_ADD, fd, &event)
+                self.active += 1
+
+            # Ports are started in order, so the oldest pending one expires first
+            now = _now_ms()
+            while self.head < self.started and (
+                    self.errors[self.head] != PENDING
+                    or self.slot_deadline[self.slot_of[self.head]] <= now):
+                if self.errors[self.head] == PENDING:
+                    self._release(self.slot_of[self.head])
+                    self._finish(self.head, ETIMEDOUT)
+                self.head += 1
+
+            throttled = self.started < self.n and self.active < self.window
+            if self.active == 0 and not throttled:
+                continue
+            if now >= stop:
+                return
+
+            # Wait until a socket is ready, the oldest attempt times out, the
+            # rate limit allows starting more or it's time to hand results back
+            wait_until = stop
+            if self.active > 0:
+                wait_until = min(wait_until, self.slot_deadline[self.slot_of[self.head]])
+            if throttled:
+                wait_until = min(wait_until, now + (1.0 - self.tokens) / self.rate * 1000.0)
+            wait_ms = <int>(wait_until - now) + 1
+            ready = epoll_wait(self.epfd, self.events, self.window, wait_ms)
+            for k in range(ready):
+                slot = <int>self.events[k].data.u64
+                # SO_ERROR holds the outcome of the non-blocking connect
+                error = 0
+                length = sizeof(error)
+                getsockopt(self.slot_fd[slot], SOL_SOCKET, SO_ERROR, &error, &length)
+                i = self.slot_index[slot]
+                self._release(slot)
+                self._finish(i, error)
+            now = _now_ms()
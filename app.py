@@ -1,14 +1,57 @@
 # Import necessary libraries
 import socket  # For network connections
+import struct  # For packing socket options
 import argparse  # For command-line argument parsing
-import concurrent.futures  # For parallel processing
+import array  # For compact port lists
+import asyncio  # For concurrent non-blocking connections
+import collections  # For tracking in-flight connections
+import contextlib  # For redirecting output to the printer thread
+import errno  # For interpreting connection errors
+import functools  # For caching service lookups
+import os  # For error descriptions
+import queue  # For the socket pool
+import select  # For waiting on a few sockets at once
+import selectors  # For waiting on many sockets at once
 import time  # For timing operations
-from typing import List, Dict  # For type hints
+from typing import Callable, List, Dict, Optional, Sequence, Tuple  # For type hints
+from dataclasses import dataclass, field  # For the scan result container
 import sys  # For system-specific operations
+import threading  # For refilling the socket pool in the background
 from colorama import init, Fore, Style  # For colored terminal output
 
-# Initialize colorama for colored output
-init()
+try:
+    import resource  # For checking the open file limit, Unix only
+except ImportError:
+    resource = None
+
+try:
+    import _scan  # Optional native backend, built with "python setup.py build_ext --inplace"
+except ImportError:
+    _scan = None
+
+try:
+    import liburing  # Optional, for io_uring based scanning on Linux
+except ImportError:
+    liburing = None
+
+# Initialize colorama for colored output, but only when writing to a terminal.
+# Piped or redirected output gets no color codes at all, which also skips
+# colorama's stdout wrapper and its per-write escape code processing
+if sys.stdout.isatty():
+    init()
+else:
+    class _NoColor:
+        """Stand-in for colorama's Fore and Style that yields empty strings."""
+        def __getattr__(self, name: str) -> str:
+            return ""
+    
+    Fore = Style = _NoColor()
+
+# Per-port messages, formatted once here and filled in with %
+OPEN_FMT = f"{Fore.GREEN}[+] Port %d: OPEN - %s{Style.RESET_ALL}"
+CLOSED_FMT = f"{Fore.RED}[-] Port %d: CLOSED{Style.RESET_ALL}"
+TIMEOUT_FMT = f"{Fore.YELLOW}[!] Port %d: TIMEOUT{Style.RESET_ALL}"
+ERROR_FMT = f"{Fore.YELLOW}[!] Error scanning port %d: %s{Style.RESET_ALL}"
 
 # Define common port ranges for different services
 # These are frequently used ports that we can scan quickly
@@ -20,10 +63,239 @@ COMMON_PORTS = {
     "remote": [22, 23, 3389, 5900]
 }
 
+# Address family and socket type for probe sockets, created non-blocking
+# in one call where the platform supports it
+_AF = socket.AF_INET
+_SOCK = socket.SOCK_STREAM | getattr(socket, "SOCK_NONBLOCK", 0)
+
+# SO_LINGER with l_onoff=1, l_linger=0 makes close() reset the connection
+# instead of leaving it in TIME_WAIT (struct linger uses u_short on Windows)
+_LINGER = struct.pack("HH" if os.name == "nt" else "ii", 1, 0)
+
+# Minimum time between progress line updates, in seconds
+PROGRESS_INTERVAL = 0.05
+
+# Upper bound for the automatically chosen concurrency
+MAX_DEFAULT_CONCURRENCY = 1024
+
+# File descriptors kept free for everything other than probe sockets
+FD_HEADROOM = 128
+
+# Outstanding asyncio tasks allowed for each unit of concurrency
+ASYNC_TASKS_PER_SLOT = 4
+
+# Scans of at most this many ports use a single select() batch
+SMALL_SCAN_PORTS = 32
+
+# Largest submission queue the kernel allows for a single ring
+URING_MAX_ENTRIES = 32768
+
+# Outcome of scanning one port: (port, is open, service name or None)
+PortResult = Tuple[int, bool, Optional[str]]
+
+@dataclass
+class ScanResult:
+    """
+    Open ports found by a scan, stored as parallel arrays.
+    ports[i] is an open port and services[i] is the service running on it.
+    """
+    ports: array.array = field(default_factory=lambda: array.array("H"))
+    services: List[str] = field(default_factory=list)
+
+class TokenBucket:
+    """
+    Token bucket limiting how many connection attempts are started per second.
+    Tokens refill continuously at `rate` per second and up to one second's
+    worth can be saved up, so short bursts are allowed but the average rate
+    never exceeds `rate`.
+    """
+    
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0")
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.ts = time.monotonic()
+    
+    def take(self, n: int = 1) -> int:
+        """
+        Take up to `n` tokens without waiting.
+        
+        Args:
+            n (int): Number of tokens wanted
+            
+        Returns:
+            int: Number of tokens actually taken, between 0 and n
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.ts) * self.rate)
+        self.ts = now
+        taken = min(n, int(self.tokens))
+        self.tokens -= taken
+        return taken
+    
+    def wait_time(self) -> float:
+        """
+        Get how long until the next token is available.
+        
+        Returns:
+            float: Time to wait in seconds
+        """
+        return max(0.0, (1.0 - self.tokens) / self.rate)
+
+class SocketPool:
+    """
+    Pool of ready-to-use probe sockets, already created and configured.
+    A background thread refills the pool, but only while the scanner is
+    blocked waiting on the network (between idle() and busy() calls), so it
+    uses time the scan loop would spend waiting anyway instead of competing
+    with it. Starting a connection attempt then only takes a socket from the queue.
+    
+    Args:
+        window (int): Maximum number of connection attempts in flight
+        total (int): Number of ports to scan, the pool never makes more sockets than that
+    """
+    
+    def __init__(self, window: int, total: int):
+        window = min(window, total)
+        self.size = window
+        # Spare sockets hold file descriptors on top of the in-flight ones, so
+        # keep no more of them than fit in the open file limit next to those
+        if resource is not None:
+            soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+            if soft != resource.RLIM_INFINITY:
+                self.size = max(0, min(window, soft - window - FD_HEADROOM))
+        self.total = total
+        self._taken = 0  # Sockets handed out by get()
+        self._sockets = queue.SimpleQueue()
+        self._idle = threading.Event()  # Set while the scanner is waiting
+        self._closed = False
+        self._thread = threading.Thread(target=self._refill, daemon=True)
+        self._thread.start()
+    
+    def _refill(self) -> None:
+        while True:
+            self._idle.wait()
+            if self._closed:
+                return
+            queued = self._sockets.qsize()
+            if self._taken + queued >= self.total:
+                # Every remaining port already has a socket waiting
+                return
+            if queued < self.size:
+                try:
+                    self._sockets.put(_new_probe_socket())
+                except OSError:
+                    # Out of file descriptors (or similar), get() creates
+                    # sockets itself from here on
+                    return
+            else:
+                # Pool is full, wait for the next time the scanner is idle
+                self.busy()
+    
+    def idle(self) -> None:
+        """
+        Signal that the scanner is about to wait, so the pool can be refilled.
+        """
+        self._idle.set()
+    
+    def busy(self) -> None:
+        """
+        Signal that the scanner is running again and refilling should pause.
+        """
+        self._idle.clear()
+    
+    def get(self) -> socket.socket:
+        """
+        Take a socket from the pool, creating one if the pool is empty.
+        
+        Returns:
+            socket.socket: A new, unconnected probe socket
+        """
+        self._taken += 1
+        try:
+            return self._sockets.get_nowait()
+        except queue.Empty:
+            return _new_probe_socket()
+    
+    def close(self) -> None:
+        """
+        Stop refilling and close the sockets that are left in the pool.
+        """
+        self._closed = True
+        self._idle.set()
+        self._thread.join()
+        while True:
+            try:
+                self._sockets.get_nowait().close()
+            except queue.Empty:
+                break
+
+class ConsoleWriter:
+    """
+    Stand-in for sys.stdout while a scan runs. Writes are only put on a
+    queue, and a dedicated thread does the actual terminal output, so a slow
+    terminal never holds up the loop collecting results.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream  # Where the output really goes
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._print, daemon=True)
+        self._thread.start()
+    
+    def _print(self) -> None:
+        while True:
+            text = self._queue.get()
+            if text is None:
+                return
+            # Write everything queued up since the last pass in one go
+            chunks = [text]
+            while True:
+                try:
+                    text = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if text is None:
+                    break
+                chunks.append(text)
+            self.stream.write("".join(chunks))
+            self.stream.flush()
+            if text is None:
+                return
+    
+    def write(self, text: str) -> int:
+        """
+        Queue text to be written by the printer thread.
+        
+        Args:
+            text (str): Text to write
+            
+        Returns:
+            int: Number of characters queued
+        """
+        self._queue.put(text)
+        return len(text)
+    
+    def flush(self) -> None:
+        """
+        Nothing to do, the printer thread flushes after every write.
+        """
+    
+    def close(self) -> None:
+        """
+        Wait for the printer thread to write out everything still queued.
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+@functools.lru_cache(maxsize=None)
 def get_service_name(port: int) -> str:
     """
     Try to identify the service running on a given port.
     This function uses the system's service database to find the service name.
+    Results, including misses, are cached so each port is looked up only once.
     
     Args:
         port (int): The port number to look up
@@ -33,10 +305,69 @@ def get_service_name(port: int) -> str:
     """
     try:
         return socket.getservbyport(port)
-    except:
+    except OSError:
+        # Port isn't in the service database
         return "unknown"
 
-def scan_port(ip: str, port: int, timeout: float = 1.0, verbose: bool = False) -> Dict:
+def _new_probe_socket() -> socket.socket:
+    """
+    Create a probe socket with the options used for every connection attempt.
+    
+    Returns:
+        socket.socket: A new, unconnected probe socket
+    """
+    s = socket.socket(_AF, _SOCK)
+    _tune_probe_socket(s)
+    return s
+
+def _tune_probe_socket(s) -> None:
+    """
+    Set the options used on every probe socket.
+    TCP_NODELAY avoids Nagle delays on the connection, and a zero linger time
+    frees the connection as soon as it's closed, so a large scan doesn't use up
+    local ports on connections waiting in TIME_WAIT.
+    
+    Args:
+        s: Socket to configure
+    """
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER)
+
+def load_services() -> Dict[int, str]:
+    """
+    Read the system's service database once and map TCP ports to service names.
+    This replaces a getservbyport lookup for every open port with a dictionary
+    lookup; ports missing from the file are still resolved by get_service_name.
+    
+    Returns:
+        Dict[int, str]: Service name for every TCP port listed in the database
+    """
+    if os.name == "nt":
+        path = os.path.join(os.environ.get("SystemRoot", r"C:\Windows"), "System32", "drivers", "etc", "services")
+    else:
+        path = "/etc/services"
+    
+    services = {}
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                # Each entry looks like "name  port/protocol  [aliases...]  [# comment]"
+                fields = line.split("#", 1)[0].split()
+                if len(fields) < 2:
+                    continue
+                port, _, protocol = fields[1].partition("/")
+                if protocol == "tcp" and port.isdigit():
+                    # Keep the first name listed, like getservbyport does
+                    services.setdefault(int(port), fields[0])
+    except OSError:
+        # No readable database, every lookup falls back to get_service_name
+        pass
+    return services
+
+# Service names for well-known ports, loaded once at startup
+PORT_TO_SERVICE = load_services()
+
+def scan_port(ip: str, port: int, timeout: float = 1.0, verbose: bool = False) -> PortResult:
     """
     Scan a single port on the target IP address.
     This function tries to establish a TCP connection to the specified port.
@@ -48,104 +379,565 @@ def scan_port(ip: str, port: int, timeout: float = 1.0, verbose: bool = False) -
         verbose (bool): Whether to print detailed information
         
     Returns:
-        Dict: A dictionary containing port information and scan results
+        PortResult: The port, whether it is open, and its service name if it is
     """
-    # Initialize the result dictionary with default values
-    result = {
-        "port": port,
-        "status": "closed",  # Default status is closed
-        "service": None  # Service name will be determined if port is open
-    }
+    is_open = False  # Default status is closed
+    service = None  # Service name will be determined if port is open
     
     try:
         # Create a new socket for the connection
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s = socket.socket(_AF, _SOCK)
+        try:
+            _tune_probe_socket(s)
             # Set the timeout for the connection attempt
             s.settimeout(timeout)
             
             # Try to connect to the port
             # connect_ex returns 0 if successful, error code otherwise
             result_code = s.connect_ex((ip, port))
+        finally:
+            s.close()
+        
+        if result_code == 0:
+            # Port is open
+            is_open = True
+            service = PORT_TO_SERVICE.get(port) or get_service_name(port)
+            if verbose:
+                print(OPEN_FMT % (port, service))
+        elif verbose:
+            # Port is closed
+            print(CLOSED_FMT % port)
             
-            if result_code == 0:
-                # Port is open
-                result["status"] = "open"
-                result["service"] = get_service_name(port)
-                if verbose:
-                    print(f"{Fore.GREEN}[+] Port {port}: OPEN - {result['service']}{Style.RESET_ALL}")
-            elif verbose:
-                # Port is closed
-                print(f"{Fore.RED}[-] Port {port}: CLOSED{Style.RESET_ALL}")
-                
     except socket.timeout:
         # Connection attempt timed out
         if verbose:
-            print(f"{Fore.YELLOW}[!] Port {port}: TIMEOUT{Style.RESET_ALL}")
+            print(TIMEOUT_FMT % port)
     except Exception as e:
         # Handle any other errors
         if verbose:
-            print(f"{Fore.YELLOW}[!] Error scanning port {port}: {str(e)}{Style.RESET_ALL}")
+            print(ERROR_FMT % (port, e))
+    
+    return port, is_open, service
+
+async def scan_port_async(ip: str, port: int, sem: asyncio.Semaphore, timeout: float = 1.0, verbose: bool = False, bucket: Optional["TokenBucket"] = None) -> PortResult:
+    """
+    Scan a single port on the target IP address without blocking the event loop.
+    The semaphore bounds how many connection attempts are in flight at once.
+    
+    Args:
+        ip (str): Target IP address to scan
+        port (int): Port number to check
+        sem (asyncio.Semaphore): Semaphore limiting concurrent connections
+        timeout (float): How long to wait for a response (in seconds)
+        verbose (bool): Whether to print detailed information
+        bucket (Optional[TokenBucket]): Rate limit for starting connection attempts
+        
+    Returns:
+        PortResult: The port, whether it is open, and its service name if it is
+    """
+    is_open = False  # Default status is closed
+    service = None  # Service name will be determined if port is open
+    
+    async with sem:
+        # Wait for the rate limit before starting the connection
+        while bucket is not None and not bucket.take():
+            await asyncio.sleep(bucket.wait_time())
+        try:
+            # Try to connect to the port, giving up after the timeout
+            _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+            # Port is open, we don't need the connection any more
+            _tune_probe_socket(writer.get_extra_info("socket"))
+            writer.close()
+            is_open = True
+            service = PORT_TO_SERVICE.get(port) or get_service_name(port)
+            if verbose:
+                print(OPEN_FMT % (port, service))
+        except asyncio.TimeoutError:
+            # Connection attempt timed out
+            if verbose:
+                print(TIMEOUT_FMT % port)
+        except ConnectionRefusedError:
+            # Port is closed
+            if verbose:
+                print(CLOSED_FMT % port)
+        except OSError as e:
+            # Handle any other network errors
+            if verbose:
+                print(ERROR_FMT % (port, e))
+    
+    return port, is_open, service
+
+async def scan_ports_async(ip: str, ports: Sequence[int], on_result: Callable[[PortResult], None], concurrency: int = 1024, timeout: float = 1.0, verbose: bool = False, bucket: Optional["TokenBucket"] = None) -> None:
+    """
+    Scan multiple ports on a target IP address concurrently using asyncio.
+    A single thread drives every connection attempt, with at most
+    `concurrency` of them in flight at the same time. Tasks are created in a
+    sliding window of ASYNC_TASKS_PER_SLOT * concurrency rather than all at
+    once, so memory use doesn't grow with the number of ports.
+    
+    Args:
+        ip (str): Target IP address
+        ports (Sequence[int]): Ports to scan
+        on_result (Callable[[PortResult], None]): Called with each port's result as it completes
+        concurrency (int): Maximum number of simultaneous connection attempts
+        timeout (float): Connection timeout in seconds
+        verbose (bool): Whether to print detailed information
+        bucket (Optional[TokenBucket]): Rate limit for starting connection attempts
+    """
+    # Limit the number of connection attempts in flight
+    sem = asyncio.Semaphore(concurrency)
+    
+    max_tasks = concurrency * ASYNC_TASKS_PER_SLOT
+    tasks = set()
+    
+    async def collect() -> None:
+        # Wait for at least one task and hand back the results of all finished ones
+        nonlocal tasks
+        done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            on_result(task.result())
+    
+    # Schedule scan tasks, keeping the number of outstanding ones bounded
+    for port in ports:
+        if len(tasks) >= max_tasks:
+            await collect()
+        tasks.add(asyncio.create_task(scan_port_async(ip, port, sem, timeout, verbose, bucket)))
+    
+    # Hand back the remaining results as they complete
+    while tasks:
+        await collect()
+
+def _connect_result(port: int, error: int, verbose: bool = False) -> PortResult:
+    """
+    Build the result for a finished non-blocking connection attempt.
+    
+    Args:
+        port (int): Port number that was checked
+        error (int): errno of the connect, 0 if it succeeded
+        verbose (bool): Whether to print detailed information
+        
+    Returns:
+        PortResult: The port, whether it is open, and its service name if it is
+    """
+    if error == 0:
+        # Port is open
+        service = PORT_TO_SERVICE.get(port) or get_service_name(port)
+        if verbose:
+            print(OPEN_FMT % (port, service))
+        return port, True, service
+    if verbose:
+        if error == errno.ETIMEDOUT:
+            print(TIMEOUT_FMT % port)
+        elif error == errno.ECONNREFUSED:
+            print(CLOSED_FMT % port)
+        else:
+            print(ERROR_FMT % (port, os.strerror(error)))
+    return port, False, None
+
+def scan_ports_epoll(ip: str, ports: Sequence[int], on_result: Callable[[PortResult], None], timeout: float = 1.0, batch_size: int = 2048, verbose: bool = False, bucket: Optional["TokenBucket"] = None) -> None:
+    """
+    Scan multiple ports on a target IP address using non-blocking sockets and epoll.
+    Every connection attempt is started with a non-blocking connect and all of
+    them are waited on together, so no thread or coroutine is needed per port.
+    
+    Args:
+        ip (str): Target IP address
+        ports (Sequence[int]): Ports to scan
+        on_result (Callable[[PortResult], None]): Called with each port's result as it completes
+        timeout (float): Connection timeout in seconds
+        batch_size (int): Maximum number of connection attempts in flight
+        verbose (bool): Whether to print detailed information
+        bucket (Optional[TokenBucket]): Rate limit for starting connection attempts
+    """
+    sel = selectors.EpollSelector()
+    pool = SocketPool(batch_size, len(ports))
+    # Sockets in the order they were started, so the oldest expires first
+    pending = collections.deque()
+    started = 0  # Number of ports whose connection attempt has been started
+    
+    try:
+        while True:
+            # Keep the window of in-flight connection attempts full, as far as
+            # the rate limit allows
+            room = min(batch_size - len(sel.get_map()), len(ports) - started)
+            throttled = False
+            if bucket is not None and room > 0:
+                allowed = bucket.take(room)
+                throttled = allowed < room
+                room = allowed
+            for port in ports[started:started + room]:
+                # Sockets are created non-blocking, epoll implies SOCK_NONBLOCK
+                s = pool.get()
+                error = s.connect_ex((ip, port))
+                if error in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    # Connection is under way, wait for the socket to become writable
+                    sel.register(s, selectors.EVENT_WRITE, port)
+                    pending.append((time.monotonic() + timeout, s))
+                else:
+                    # Connection finished (or failed) straight away
+                    s.close()
+                    on_result(_connect_result(port, error, verbose))
+            started += room
+            
+            # Expire connection attempts that ran out of time
+            now = time.monotonic()
+            while pending and (pending[0][1].fileno() == -1 or pending[0][0] <= now):
+                _, s = pending.popleft()
+                if s.fileno() != -1:
+                    port = sel.unregister(s).data
+                    s.close()
+                    on_result(_connect_result(port, errno.ETIMEDOUT, verbose))
+            
+            if not pending:
+                if started == len(ports):
+                    break
+                if throttled:
+                    # Nothing in flight, wait for the rate limit
+                    pool.idle()
+                    time.sleep(bucket.wait_time())
+                    pool.busy()
+                continue
+            
+            # Wait until a socket is ready, the oldest attempt times out or
+            # the rate limit allows starting more
+            wait = pending[0][0] - now
+            if throttled:
+                wait = min(wait, bucket.wait_time())
+            pool.idle()
+            ready = sel.select(wait)
+            pool.busy()
+            for key, _ in ready:
+                s = key.fileobj
+                # SO_ERROR holds the outcome of the non-blocking connect
+                error = s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                sel.unregister(s)
+                s.close()
+                on_result(_connect_result(key.data, error, verbose))
+    finally:
+        # Don't leak sockets if the scan is interrupted
+        for key in list(sel.get_map().values()):
+            key.fileobj.close()
+        sel.close()
+        pool.close()
+
+def scan_ports_uring(ip: str, ports: Sequence[int], on_result: Callable[[PortResult], None], timeout: float = 1.0, batch_size: int = 2048, verbose: bool = False, bucket: Optional["TokenBucket"] = None) -> None:
+    """
+    Scan multiple ports on a target IP address using io_uring.
+    Each connect is queued on the ring together with a linked timeout and a
+    whole window of them is handed to the kernel with a single submit. Falls
+    back to scan_ports_epoll when the ring can't be set up.
     
-    return result
+    Args:
+        ip (str): Target IP address
+        ports (Sequence[int]): Ports to scan
+        on_result (Callable[[PortResult], None]): Called with each port's result as it completes
+        timeout (float): Connection timeout in seconds
+        batch_size (int): Maximum number of connection attempts in flight
+        verbose (bool): Whether to print detailed information
+        bucket (Optional[TokenBucket]): Rate limit for starting connection attempts
+    """
+    # Every attempt needs two entries on the ring: the connect and its timeout
+    batch_size = min(batch_size, URING_MAX_ENTRIES // 2)
+    ring = liburing.Ring()
+    # liburing takes a ring on fd 0 for one that was never set up, so if stdin
+    # is closed keep fd 0 taken until the ring has its descriptor
+    placeholder = None
+    try:
+        os.fstat(0)
+    except OSError:
+        placeholder = os.open(os.devnull, os.O_RDONLY)
+    try:
+        liburing.io_uring_queue_init(batch_size * 2, ring)
+    except OSError:
+        # io_uring is unavailable (old kernel or disabled), use epoll instead
+        scan_ports_epoll(ip, ports, on_result, timeout, batch_size, verbose, bucket)
+        return
+    finally:
+        if placeholder is not None:
+            os.close(placeholder)
+    
+    cqe = liburing.Cqe()
+    pool = SocketPool(batch_size, len(ports))
+    connect_timeout = liburing.timespec(timeout)
+    # Port, socket and address of every in-flight attempt keyed by file
+    # descriptor; they must stay alive until the kernel reports the attempt done
+    in_flight = {}
+    started = 0  # Number of ports whose connection attempt has been started
+    
+    try:
+        while True:
+            # Queue connects until the window is full (or the rate limit is
+            # reached), then submit them at once
+            room = min(batch_size - len(in_flight), len(ports) - started)
+            throttled = False
+            if bucket is not None and room > 0:
+                allowed = bucket.take(room)
+                throttled = allowed < room
+                room = allowed
+            for port in ports[started:started + room]:
+                s = pool.get()
+                addr = liburing.Sockaddr(socket.AF_INET, ip, port)
+                in_flight[s.fileno()] = (port, s, addr)
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_connect(sqe, s.fileno(), addr)
+                # Tag connects with fd + 1 so none can be mistaken for a timeout,
+                # even a socket that got fd 0 because stdin was closed
+                liburing.io_uring_sqe_set_data64(sqe, s.fileno() + 1)
+                liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+                # The linked timeout cancels the connect if it takes too long
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_link_timeout(sqe, connect_timeout, 0)
+                liburing.io_uring_sqe_set_data64(sqe, 0)
+            if room:
+                liburing.io_uring_submit(ring)
+                started += room
+            
+            if not in_flight:
+                if started == len(ports):
+                    break
+                if throttled:
+                    # Nothing in flight, wait for the rate limit
+                    pool.idle()
+                    time.sleep(bucket.wait_time())
+                    pool.busy()
+                continue
+            
+            # Wait for at least one completion (or until the rate limit allows
+            # starting more), then reap everything that's ready
+            pool.idle()
+            try:
+                if throttled:
+                    liburing.io_uring_wait_cqe_timeout(ring, cqe, liburing.timespec(bucket.wait_time()))
+                else:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+            except OSError as e:
+                if e.errno != errno.ETIME:
+                    raise
+                continue
+            finally:
+                pool.busy()
+            # CqeIter follows the ring's wrap-around; indexing cqe[i] directly
+            # would run past the end of the completion queue
+            ready = 0
+            for _ in liburing.CqeIter(ring, cqe):
+                ready += 1
+                entry = cqe[0]
+                tag = entry.user_data
+                if tag == 0:
+                    # Completion of a linked timeout, nothing to report
+                    continue
+                try:
+                    # Negative results are raised as the matching OSError
+                    error = -entry.res
+                except OSError as e:
+                    error = e.errno
+                if error == errno.ECANCELED:
+                    # The linked timeout fired before the connect finished
+                    error = errno.ETIMEDOUT
+                port, s, _ = in_flight.pop(tag - 1)
+                s.close()
+                on_result(_connect_result(port, error, verbose))
+            liburing.io_uring_cq_advance(ring, ready)
+    finally:
+        # Tearing down the ring cancels anything still in flight
+        liburing.io_uring_queue_exit(ring)
+        for _, s, _ in in_flight.values():
+            s.close()
+        pool.close()
 
-def scan_ports(ip: str, ports: List[int], max_workers: int = 100, timeout: float = 1.0, verbose: bool = False) -> List[Dict]:
+def scan_ports_select(ip: str, ports: Sequence[int], on_result: Callable[[PortResult], None], timeout: float = 1.0, verbose: bool = False) -> None:
     """
-    Scan multiple ports on a target IP address using multiple threads.
-    This function uses ThreadPoolExecutor to scan ports concurrently.
+    Scan a handful of ports on a target IP address with select().
+    All connects are started at once and waited on together. For a few ports
+    this beats the other backends, whose setup (event loop, ring, epoll
+    instance) would take longer than the scan itself. select() can only watch
+    a limited number of sockets, so this is meant for small scans only.
     
     Args:
         ip (str): Target IP address
-        ports (List[int]): List of ports to scan
-        max_workers (int): Maximum number of concurrent threads
+        ports (Sequence[int]): Ports to scan, at most SMALL_SCAN_PORTS
+        on_result (Callable[[PortResult], None]): Called with each port's result as it completes
         timeout (float): Connection timeout in seconds
         verbose (bool): Whether to print detailed information
+    """
+    in_flight = {}  # Port of every socket still connecting
+    try:
+        for port in ports:
+            s = socket.socket(_AF, _SOCK)
+            if _SOCK == socket.SOCK_STREAM:
+                # No SOCK_NONBLOCK on this platform (e.g. Windows)
+                s.setblocking(False)
+            _tune_probe_socket(s)
+            error = s.connect_ex((ip, port))
+            if error in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                in_flight[s] = port
+            else:
+                # Connection finished (or failed) straight away
+                s.close()
+                on_result(_connect_result(port, error, verbose))
+        
+        # Failed connects show up as writable, or as exceptional on Windows
+        deadline = time.monotonic() + timeout
+        while in_flight:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            waiting = list(in_flight)
+            _, writable, failed = select.select([], waiting, waiting, remaining)
+            for s in set(writable) | set(failed):
+                error = s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                port = in_flight.pop(s)
+                s.close()
+                on_result(_connect_result(port, error, verbose))
+        
+        # Whatever is left ran out of time
+        for s, port in list(in_flight.items()):
+            del in_flight[s]
+            s.close()
+            on_result(_connect_result(port, errno.ETIMEDOUT, verbose))
+    finally:
+        # Don't leak sockets if the scan is interrupted
+        for s in in_flight:
+            s.close()
+
+def scan_ports_native(ip: str, ports: Sequence[int], on_result: Callable[[PortResult], None], timeout: float = 1.0, batch_size: int = 2048, verbose: bool = False, bucket: Optional["TokenBucket"] = None) -> None:
+    """
+    Scan multiple ports on a target IP address using the compiled _scan extension.
+    This is the same technique as scan_ports_epoll, but the loop that creates
+    sockets, connects and waits on epoll runs in C, so Python only handles
+    ports that have finished.
+    
+    Args:
+        ip (str): Target IP address
+        ports (Sequence[int]): Ports to scan
+        on_result (Callable[[PortResult], None]): Called with each port's result as it completes
+        timeout (float): Connection timeout in seconds
+        batch_size (int): Maximum number of connection attempts in flight
+        verbose (bool): Whether to print detailed information
+        bucket (Optional[TokenBucket]): Rate limit for starting connection attempts
+    """
+    # The extension works on flat buffers: ports in, errno per port and
+    # completion order out
+    if not (isinstance(ports, array.array) and ports.typecode == "H"):
+        ports = array.array("H", ports)
+    errors = array.array("i", [0]) * len(ports)
+    order = array.array("i", [0]) * len(ports)
+    rate = bucket.rate if bucket is not None else 0.0
+    scanner = _scan.Scanner(socket.inet_aton(ip), ports, int(timeout * 1000), batch_size, errors, order, rate)
+    
+    # Let the extension run in slices so results and progress keep flowing
+    reported = 0
+    while reported < len(ports):
+        done = scanner.run(PROGRESS_INTERVAL * 1000)
+        for i in order[reported:done]:
+            on_result(_connect_result(ports[i], errors[i], verbose))
+        reported = done
+
+# Scanning backends available on this platform, in order of preference
+BACKENDS = (
+    (["native"] if _scan is not None else [])
+    + (["uring"] if liburing is not None else [])
+    + (["epoll"] if hasattr(selectors, "EpollSelector") else [])
+    + ["asyncio"]
+)
+
+def scan_ports(ip: str, ports: Sequence[int], concurrency: int = 1024, timeout: float = 1.0, verbose: bool = False, backend: str = "auto", rate: Optional[float] = None) -> ScanResult:
+    """
+    Scan multiple ports on a target IP address concurrently.
+    The work is handed to one of the scanning backends while this function
+    collects open ports and keeps the progress display up to date.
+    
+    Args:
+        ip (str): Target IP address
+        ports (Sequence[int]): Ports to scan
+        concurrency (int): Maximum number of simultaneous connection attempts
+        timeout (float): Connection timeout in seconds
+        verbose (bool): Whether to print detailed information
+        backend (str): One of BACKENDS, or 'auto' to pick the fastest available
+        rate (Optional[float]): Maximum connection attempts started per second, None for no limit
         
     Returns:
-        List[Dict]: List of scan results for open ports
+        ScanResult: The open ports and their service names
     """
-    open_ports = []  # Store results for open ports
+    # Resolve the target once. Backends then all get the canonical dotted quad,
+    # which every connect parses on its numeric fast path, so shorthand forms
+    # accepted by validate_ip (like "127.1") never reach getaddrinfo per port
+    packed_ip = socket.inet_aton(ip)
+    ip = socket.inet_ntoa(packed_ip)
+    
+    open_ports = ScanResult()  # Store results for open ports
     total_ports = len(ports)  # Total number of ports to scan
     scanned_ports = 0  # Counter for progress tracking
+    last_print = 0.0  # When the progress line was last written
     
     # Print scan information
     print(f"\n{Fore.CYAN}Scanning {ip}...{Style.RESET_ALL}")
     print(f"Total ports to scan: {total_ports}")
     
-    # Create a thread pool for concurrent scanning
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all port scans to the thread pool
-        future_to_port = {
-            executor.submit(scan_port, ip, port, timeout, verbose): port 
-            for port in ports
-        }
-        
-        # Process results as they complete
-        for future in concurrent.futures.as_completed(future_to_port):
-            scanned_ports += 1
-            result = future.result()
-            
-            # If port is open, add it to the results
-            if result["status"] == "open":
-                open_ports.append(result)
-            
-            # Update and display progress
+    def record(result: PortResult) -> None:
+        nonlocal scanned_ports, last_print
+        scanned_ports += 1
+        
+        # If port is open, add it to the results
+        port, is_open, service = result
+        if is_open:
+            open_ports.ports.append(port)
+            open_ports.services.append(service)
+        
+        # Update and display progress, at most every PROGRESS_INTERVAL seconds
+        # so terminal writes don't slow down collecting results
+        now = time.monotonic()
+        if now - last_print > PROGRESS_INTERVAL or scanned_ports == total_ports:
+            last_print = now
             progress = (scanned_ports / total_ports) * 100
             sys.stdout.write(f"\rProgress: {progress:.1f}% ({scanned_ports}/{total_ports})")
             sys.stdout.flush()
     
-    print("\n")
+    bucket = TokenBucket(rate) if rate else None
+    
+    if backend == "auto":
+        backend = BACKENDS[0]
+        # A handful of ports is done before most backends have finished setting
+        # up, so unless the native one is available use a single select() batch
+        # (provided the rate limit allows starting them all at once)
+        if backend != "native" and len(ports) <= SMALL_SCAN_PORTS and (bucket is None or bucket.capacity >= len(ports)):
+            backend = "select"
+    
+    # Everything printed during the scan, progress and verbose messages from
+    # the backends alike, goes through the printer thread
+    console = ConsoleWriter(sys.stdout)
+    
+    try:
+        with contextlib.redirect_stdout(console):
+            if backend == "native":
+                scan_ports_native(ip, ports, record, timeout, concurrency, verbose, bucket)
+            elif backend == "uring":
+                scan_ports_uring(ip, ports, record, timeout, concurrency, verbose, bucket)
+            elif backend == "epoll":
+                scan_ports_epoll(ip, ports, record, timeout, concurrency, verbose, bucket)
+            elif backend == "select":
+                scan_ports_select(ip, ports, record, timeout, verbose)
+            else:
+                asyncio.run(scan_ports_async(ip, ports, record, concurrency, timeout, verbose, bucket))
+            
+            print("\n")
+    finally:
+        # Don't return (or let an interrupt through) before all output is written
+        console.close()
     return open_ports
 
-def parse_ports(port_arg: str) -> List[int]:
+def parse_ports(port_arg: str) -> Sequence[int]:
     """
     Parse the port argument to determine which ports to scan.
     This function handles different port specification formats.
+    Ranges are returned as `range` objects and long port lists as compact
+    arrays, so large scans don't build tens of thousands of int objects.
     
     Args:
         port_arg (str): Port specification string
         
     Returns:
-        List[int]: List of ports to scan
+        Sequence[int]: Ports to scan
         
     Raises:
         ValueError: If port range is invalid
@@ -155,20 +947,23 @@ def parse_ports(port_arg: str) -> List[int]:
         return COMMON_PORTS[port_arg]
     # Check if scanning all ports
     elif port_arg == "all":
-        return list(range(1, 65536))
+        return range(1, 65536)
     # Check if it's a port range (e.g., "80-100")
     elif "-" in port_arg:
         start, end = map(int, port_arg.split("-"))
         # Validate port range
         if not (1 <= start <= end <= 65535):
             raise ValueError("Port range must be between 1 and 65535")
-        return list(range(start, end + 1))
+        return range(start, end + 1)
     # Handle comma-separated list of ports
     else:
         ports = [int(port) for port in port_arg.split(",")]
         # Validate each port
         if not all(1 <= port <= 65535 for port in ports):
             raise ValueError("Ports must be between 1 and 65535")
+        # Store long lists as unsigned shorts, 2 bytes per port
+        if len(ports) > 1024:
+            return array.array("H", ports)
         return ports
 
 def validate_ip(ip: str) -> bool:
@@ -187,6 +982,41 @@ def validate_ip(ip: str) -> bool:
     except socket.error:
         return False
 
+def default_concurrency() -> int:
+    """
+    Pick a concurrency level based on the number of CPU cores.
+    
+    Returns:
+        int: Number of simultaneous connection attempts to use
+    """
+    return min(MAX_DEFAULT_CONCURRENCY, max(64, (os.cpu_count() or 1) * 128))
+
+def raise_fd_limit(needed: int) -> Optional[int]:
+    """
+    Try to raise the open file limit so `needed` sockets can be open at once.
+    Every in-flight connection attempt holds a file descriptor, and running out
+    makes connects fail with EMFILE.
+    
+    Args:
+        needed (int): Number of file descriptors the scan needs
+        
+    Returns:
+        Optional[int]: The resulting soft limit, or None if it can't be determined
+    """
+    if resource is None:
+        # Not available on this platform (e.g. Windows)
+        return None
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < needed:
+        target = needed if hard == resource.RLIM_INFINITY else min(hard, needed)
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+            soft = target
+        except (ValueError, OSError):
+            # Not allowed to raise it, keep the current limit
+            pass
+    return None if soft == resource.RLIM_INFINITY else soft
+
 def main():
     """
     Main function that handles command-line arguments and orchestrates the scanning process.
@@ -202,27 +1032,53 @@ def main():
         required=True
     )
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output")
-    parser.add_argument("-w", "--workers", type=int, default=100, help="Maximum number of concurrent workers")
+    parser.add_argument(
+        "-c", "--concurrency", "-w", "--workers",
+        dest="concurrency", type=int, default=None,
+        help="Maximum number of simultaneous connection attempts (default: based on CPU count and open file limit; -w/--workers is kept as an alias)"
+    )
+    parser.add_argument(
+        "-b", "--backend", choices=["auto"] + BACKENDS, default="auto",
+        help="Scanning backend to use (default: fastest available)"
+    )
+    parser.add_argument(
+        "-r", "--rate", type=float, default=0,
+        help="Maximum connection attempts started per second, 0 for no limit (default: 0)"
+    )
     parser.add_argument("-to", "--timeout", type=float, default=1.0, help="Connection timeout in seconds")
     
     # Parse command-line arguments
     args = parser.parse_args()
+    if args.concurrency is not None and args.concurrency < 1:
+        parser.error("concurrency must be at least 1")
+    if args.rate < 0:
+        parser.error("rate must not be negative")
 
     # Validate IP address
     if not validate_ip(args.target):
         print(f"{Fore.RED}Error: Invalid IP address format{Style.RESET_ALL}")
         return
 
+    # Size the scan to what the machine and its open file limit allow
+    concurrency = args.concurrency if args.concurrency is not None else default_concurrency()
+    # The epoll and uring backends also keep up to one spare socket per
+    # connection attempt ready, so ask for room for those as well
+    fd_limit = raise_fd_limit(concurrency * 2 + FD_HEADROOM)
+    if fd_limit is not None and concurrency > fd_limit - FD_HEADROOM:
+        if args.concurrency is not None:
+            print(f"{Fore.YELLOW}Warning: open file limit is {fd_limit}, reducing concurrency to {max(1, fd_limit - FD_HEADROOM)}{Style.RESET_ALL}")
+        concurrency = max(1, fd_limit - FD_HEADROOM)
+
     try:
         # Parse ports and start scanning
         ports = parse_ports(args.ports)
-        open_ports = scan_ports(args.target, ports, args.workers, args.timeout, args.verbose)
+        open_ports = scan_ports(args.target, ports, concurrency, args.timeout, args.verbose, args.backend, args.rate)
         
         # Display results
-        if open_ports:
+        if open_ports.ports:
             print(f"\n{Fore.GREEN}Open ports on {args.target}:{Style.RESET_ALL}")
-            for port_info in open_ports:
-                print(f"{Fore.GREEN}[+] Port {port_info['port']}: OPEN - {port_info['service']}{Style.RESET_ALL}")
+            for port, service in zip(open_ports.ports, open_ports.services):
+                print(OPEN_FMT % (port, service))
         else:
             print(f"\n{Fore.YELLOW}No open ports found on {args.target}{Style.RESET_ALL}")
             
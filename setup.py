@@ -0,0 +1,14 @@
+"""
+Build script for the optional native scanning backend.
+
+    python setup.py build_ext --inplace
+
+Requires Cython and a C compiler; Linux only. app.py works without it.
+"""
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    name="port-scanner",
+    ext_modules=cythonize([Extension("_scan", ["_scan.pyx"])]),
+)
@@ -1,18 +1,12 @@
-import socket
+from app import scan_port as _scan_port
 
 
 def scan_port(ip, port):
     """Scan a single port on the target IP."""
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(1)  
-            result = s.connect_ex((ip, port))
-            if result == 0:
-                return True
-            return False
-    except Exception as e:
-        print(f"Error scanning port {port} on {ip}: {e}")
-        return False
+    # Delegate to the scanner in app.py so there's only one implementation
+    _, is_open, _ = _scan_port(ip, port)
+    return is_open
 
 
-print(scan_port('127.0.0.1',8000))
\ No newline at end of file
+if __name__ == "__main__":
+    print(scan_port('127.0.0.1', 8000))